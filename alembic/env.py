@@ -7,7 +7,7 @@ import asyncio
 import os
 import sys
 from logging.config import fileConfig
-from sqlalchemy import pool
+from sqlalchemy import pool, text
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
 from alembic import context
@@ -59,26 +59,56 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
-def do_run_migrations(connection: Connection) -> None:
-    """실제 마이그레이션 실행"""
-    context.configure(
-        connection=connection,
-        target_metadata=target_metadata,
-        compare_type=True,
-        compare_server_default=True,
-    )
+# 마이그레이션 advisory lock 키 (레플리카 중 하나만 실행하도록 보장)
+MIGRATION_LOCK_ID = 912_003_817
 
-    with context.begin_transaction():
-        context.run_migrations()
+
+def do_run_migrations(connection: Connection) -> None:
+    """실제 마이그레이션 실행 (advisory lock으로 중복 실행 방지)"""
+    locked = connection.execute(
+        text("SELECT pg_try_advisory_lock(:key)"), {"key": MIGRATION_LOCK_ID}
+    ).scalar()
+    if not locked:
+        # 다른 레플리카가 이미 마이그레이션 중
+        return
+
+    try:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            compare_type=True,
+            compare_server_default=True,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+    finally:
+        connection.execute(
+            text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_ID}
+        )
 
 
 async def run_async_migrations() -> None:
     """
     비동기 모드에서 마이그레이션 실행
+
+    앱 내장 실행(ALEMBIC_EMBEDDED=1)이라도 앱의 엔진/풀은 재사용하지 않음:
+    이 함수는 워커 스레드의 별도 이벤트 루프(asyncio.run)에서 돌기 때문에
+    루프에 묶인 asyncpg 커넥션을 공유 풀과 주고받으면 루프 종료 후
+    "Event loop is closed"로 풀이 오염됨. 항상 일회용 NullPool 엔진을
+    만들어 실행 후 폐기
     """
+    if os.getenv("ALEMBIC_EMBEDDED") == "1":
+        # 앱 설정의 URL 사용 (asyncpg 드라이버)
+        from app.core.config import settings
+
+        url = settings.DATABASE_URL
+    else:
+        url = get_database_url()
+
     configuration = config.get_section(config.config_ini_section, {})
-    configuration["sqlalchemy.url"] = get_database_url()
-    
+    configuration["sqlalchemy.url"] = url
+
     connectable = async_engine_from_config(
         configuration,
         prefix="sqlalchemy.",
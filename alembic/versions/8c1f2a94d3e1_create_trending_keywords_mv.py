@@ -0,0 +1,53 @@
+"""트렌딩 키워드 집계용 구체화 뷰 생성
+
+대시보드 조회마다 news_articles 전체를 집계하는 대신
+주기적으로 갱신되는 작은 테이블에서 인덱스 조회로 처리
+
+Revision ID: 8c1f2a94d3e1
+Revises:
+Create Date: 2025-08-27
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "8c1f2a94d3e1"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_trending_keywords AS
+        SELECT
+            unnest(tags) AS keyword,
+            count(*) FILTER (
+                WHERE published_at > now() - interval '1 hour'
+            ) AS freq_1h,
+            count(*) FILTER (
+                WHERE published_at > now() - interval '24 hours'
+            ) AS freq_24h,
+            (count(*) FILTER (
+                WHERE published_at > now() - interval '1 hour'
+            ))::float * 24
+                / GREATEST(count(*) FILTER (
+                    WHERE published_at > now() - interval '24 hours'
+                ), 1) AS trend_score,
+            max(published_at) AS last_seen
+        FROM news_articles
+        WHERE tags IS NOT NULL
+        GROUP BY 1
+        """
+    )
+    # REFRESH ... CONCURRENTLY 사용을 위해 유니크 인덱스 필요
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_trending_keywords_keyword "
+        "ON mv_trending_keywords (keyword)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_trending_keywords")
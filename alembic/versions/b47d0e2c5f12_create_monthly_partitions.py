@@ -0,0 +1,62 @@
+"""news_articles/email_logs 월별 파티션 생성
+
+단조 증가 테이블의 인덱스 크기와 autovacuum 비용을 파티션 단위로 제한.
+향후 월 파티션은 스케줄 잡에서 동일한 패턴으로 미리 생성
+
+Revision ID: b47d0e2c5f12
+Revises: 8c1f2a94d3e1
+Create Date: 2025-08-27
+
+"""
+from datetime import date
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b47d0e2c5f12"
+down_revision = "8c1f2a94d3e1"
+branch_labels = None
+depends_on = None
+
+# 파티션을 미리 생성할 범위 (현재 월 포함 12개월)
+_START = date(2025, 8, 1)
+_MONTHS = 12
+
+# (파티션 대상 테이블, 파티션 키 컬럼)
+_PARTITIONED_TABLES = ("news_articles", "email_logs")
+
+
+def _month_bounds(start: date, count: int):
+    """(파티션 접미사, 시작일, 종료일) 튜플 생성"""
+    year, month = start.year, start.month
+    for _ in range(count):
+        next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+        yield (
+            f"{year:04d}_{month:02d}",
+            f"{year:04d}-{month:02d}-01",
+            f"{next_year:04d}-{next_month:02d}-01",
+        )
+        year, month = next_year, next_month
+
+
+def upgrade() -> None:
+    for table in _PARTITIONED_TABLES:
+        for suffix, lower, upper in _month_bounds(_START, _MONTHS):
+            op.execute(
+                f"CREATE TABLE IF NOT EXISTS {table}_{suffix} "
+                f"PARTITION OF {table} "
+                f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+            )
+        # 범위 밖 행이 삽입 실패하지 않도록 DEFAULT 파티션 유지
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS {table}_default "
+            f"PARTITION OF {table} DEFAULT"
+        )
+
+
+def downgrade() -> None:
+    for table in _PARTITIONED_TABLES:
+        op.execute(f"DROP TABLE IF EXISTS {table}_default")
+        for suffix, _, _ in _month_bounds(_START, _MONTHS):
+            op.execute(f"DROP TABLE IF EXISTS {table}_{suffix}")
@@ -0,0 +1,51 @@
+"""서버 측 uuidv7() 함수 추가
+
+UUIDMixin.id의 server_default가 참조하는 시간 정렬 UUID 생성 함수.
+Postgres 18의 내장 uuidv7()이 없는 버전을 위한 SQL 폴리필로,
+gen_random_uuid() 결과의 선두 6바이트를 밀리초 타임스탬프로 덮고
+버전 비트를 7로 맞춤
+
+Revision ID: d91a6f03c7b4
+Revises: b47d0e2c5f12
+Create Date: 2025-08-27
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "d91a6f03c7b4"
+down_revision = "b47d0e2c5f12"
+branch_labels = None
+depends_on = None
+
+_UUIDV7_FN = """
+CREATE OR REPLACE FUNCTION uuidv7() RETURNS uuid AS $$
+  SELECT encode(
+    set_bit(
+      set_bit(
+        overlay(
+          uuid_send(gen_random_uuid())
+          PLACING substring(
+            int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+            FROM 3
+          )
+          FROM 1 FOR 6
+        ),
+        52, 1
+      ),
+      53, 1
+    ),
+    'hex')::uuid;
+$$ LANGUAGE sql VOLATILE;
+"""
+
+
+def upgrade() -> None:
+    # gen_random_uuid()는 PG 13+ 내장이지만 구버전 호환을 위해 pgcrypto 유지
+    op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    op.execute(_UUIDV7_FN)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS uuidv7()")
@@ -0,0 +1,60 @@
+"""updated_at 자동 갱신 트리거 추가
+
+TimestampMixin.updated_at의 server_onupdate=func.now()는 DDL을 만들지
+않으므로 실제 갱신은 DB 트리거가 수행해야 함. init.sql의
+update_updated_at_column() 함수를 여기서도 보장 설치하고
+updated_at 컬럼을 가진 모든 테이블에 BEFORE UPDATE 트리거를 건다
+
+Revision ID: f3b82c61a9d0
+Revises: d91a6f03c7b4
+Create Date: 2025-08-27
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "f3b82c61a9d0"
+down_revision = "d91a6f03c7b4"
+branch_labels = None
+depends_on = None
+
+_TRIGGER_FN = """
+CREATE OR REPLACE FUNCTION update_updated_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = NOW();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# TimestampMixin을 사용하는 테이블들
+_TABLES = (
+    "users",
+    "user_preferences",
+    "news_articles",
+    "news_summaries",
+    "news_keywords",
+    "recipients",
+    "email_templates",
+    "email_logs",
+    "email_digests",
+)
+
+
+def upgrade() -> None:
+    op.execute(_TRIGGER_FN)
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_updated_at "
+            f"BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION update_updated_at_column()"
+        )
+
+
+def downgrade() -> None:
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS update_updated_at_column()")
@@ -0,0 +1,116 @@
+"""
+Redis 읽기 캐시 모듈
+직렬화된 응답 본문을 짧은 TTL로 캐싱하여 반복 조회 쿼리 제거
+"""
+
+from typing import Optional
+
+import redis.asyncio as aioredis
+from loguru import logger
+
+from app.core.config import settings
+
+# 애플리케이션 수명 동안 공유되는 클라이언트 (lifespan에서 초기화)
+_redis: Optional[aioredis.Redis] = None
+
+# 피드류 응답의 기본 TTL — 크롤링 주기보다 짧게 유지
+DEFAULT_TTL = 60
+
+
+async def init_cache() -> None:
+    """
+    Redis 클라이언트 초기화
+    lifespan 시작 시 한 번 호출
+    """
+    global _redis
+    _redis = aioredis.from_url(
+        settings.REDIS_URL,
+        encoding="utf-8",
+        decode_responses=False,  # 본문은 직렬화된 bytes 그대로 저장/반환
+    )
+
+
+async def close_cache() -> None:
+    """Redis 연결 종료"""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
+
+
+async def check_redis_health() -> str:
+    """
+    Redis 연결 상태 확인
+
+    Returns:
+        str: "connected" 또는 "error"
+    """
+    if _redis is None:
+        return "error"
+    try:
+        await _redis.ping()
+        return "connected"
+    except Exception:
+        return "error"
+
+
+def feed_cache_key(category: str, page: int, lang: str = "ko") -> str:
+    """뉴스 피드 응답 캐시 키 생성"""
+    return f"feed:{category}:{page}:{lang}"
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """
+    캐시된 응답 본문 조회
+
+    캐시 장애는 원본 쿼리로 폴백해야 하므로 예외를 삼키고 miss로 처리
+
+    Args:
+        key: 캐시 키
+
+    Returns:
+        Optional[bytes]: 직렬화된 본문, miss 시 None
+    """
+    if _redis is None:
+        return None
+    try:
+        return await _redis.get(key)
+    except Exception as e:
+        logger.warning(f"캐시 조회 실패 (miss 처리): {e}")
+        return None
+
+
+async def cache_set(key: str, body: bytes, ttl: int = DEFAULT_TTL) -> None:
+    """
+    직렬화된 응답 본문 캐싱
+
+    Args:
+        key: 캐시 키
+        body: orjson 등으로 직렬화된 본문
+        ttl: 만료 시간 (초)
+    """
+    if _redis is None:
+        return
+    try:
+        await _redis.set(key, body, ex=ttl)
+    except Exception as e:
+        logger.warning(f"캐시 저장 실패 (무시): {e}")
+
+
+async def invalidate_prefix(prefix: str) -> None:
+    """
+    접두사로 캐시 무효화
+
+    크롤러가 새 기사를 적재한 직후 피드 캐시를 비울 때 사용.
+    KEYS 대신 SCAN을 사용해 Redis를 블로킹하지 않음
+
+    Args:
+        prefix: 삭제할 키 접두사 (예: "feed:")
+    """
+    if _redis is None:
+        return
+    try:
+        async for key in _redis.scan_iter(match=f"{prefix}*", count=500):
+            await _redis.delete(key)
+    except Exception as e:
+        logger.warning(f"캐시 무효화 실패 (무시): {e}")
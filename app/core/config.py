@@ -3,8 +3,10 @@
 환경 변수를 통한 설정값 로드 및 검증
 """
 
-from typing import List, Optional, Any, Dict
-from pydantic import BaseSettings, validator, EmailStr, PostgresDsn
+import functools
+from typing import List, Literal, Optional, Any, Dict
+from pydantic import field_validator, EmailStr, PostgresDsn
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -12,6 +14,8 @@ class Settings(BaseSettings):
     애플리케이션 전체 설정
     환경 변수 또는 .env 파일에서 값을 로드
     """
+
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
     
     # 기본 앱 정보
     PROJECT_NAME: str = "NewsBite API"
@@ -25,25 +29,36 @@ class Settings(BaseSettings):
     
     # 데이터베이스 설정
     DATABASE_URL: str = "postgresql+asyncpg://newsbite_user:newsbite_password@db:5432/newsbite"
+    DB_POOL_SIZE: int = 20       # 커넥션 풀 기본 크기
+    DB_MAX_OVERFLOW: int = 30    # 풀 초과 허용 커넥션 수
+    DB_POOL_TIMEOUT: int = 10    # 커넥션 대기 타임아웃 (초)
+
+    # 마이그레이션 실행 모드
+    # sync: 기동 시 대기, async: 백그라운드 실행, skip: 실행 안 함
+    MIGRATION_MODE: Literal["sync", "async", "skip"] = "async"
     
-    @validator("DATABASE_URL", pre=True)
+    @field_validator("DATABASE_URL", mode="before")
+    @classmethod
     def assemble_db_connection(cls, v: Optional[str]) -> Any:
         """데이터베이스 URL 유효성 검증"""
         if isinstance(v, str):
             return v
-        return PostgresDsn.build(
+        return str(PostgresDsn.build(
             scheme="postgresql+asyncpg",
-            user=v.get("user"),
+            username=v.get("user"),
             password=v.get("password"),
             host=v.get("host"),
             port=v.get("port"),
-            path=f"/{v.get('path') or ''}",
-        )
+            path=v.get("path") or "",
+        ))
     
     # Redis 설정
     REDIS_URL: str = "redis://redis:6379"
     REDIS_TTL: int = 3600  # 1시간
     
+    # 비밀번호 해싱 설정
+    HASH_ROUNDS: int = 10  # bcrypt 라운드 수 (기본 12에서 하향)
+
     # JWT 토큰 설정
     SECRET_KEY: str = "your-super-secret-key-change-this-in-production"
     ALGORITHM: str = "HS256"
@@ -57,7 +72,8 @@ class Settings(BaseSettings):
         "http://frontend:3000"
     ]
     
-    @validator("BACKEND_CORS_ORIGINS", pre=True)
+    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
+    @classmethod
     def assemble_cors_origins(cls, v: str | List[str]) -> List[str]:
         """CORS 오리진 설정 파싱"""
         if isinstance(v, str) and not v.startswith("["):
@@ -124,11 +140,21 @@ class Settings(BaseSettings):
     # 페이지네이션 기본값
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
-    
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    설정 인스턴스 반환 (최초 1회만 .env 파싱/검증)
+
+    테스트에서는 get_settings.cache_clear() 후 환경 변수를 바꿔
+    재생성할 수 있음
+
+    Returns:
+        Settings: 캐시된 설정 인스턴스
+    """
+    return Settings()
 
 
 # 전역 설정 인스턴스
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
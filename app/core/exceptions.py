@@ -4,8 +4,9 @@
 """
 
 from typing import Any, Dict, Optional, List
-from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 
 
@@ -168,17 +169,61 @@ class ExternalServiceError(BaseCustomException):
 
 # 에러 핸들러 함수들
 
-async def custom_exception_handler(request: Request, exc: BaseCustomException) -> JSONResponse:
+# 자주 발생하는 상태 코드의 응답 본문을 미리 직렬화해 둠
+# (메시지가 고정이므로 에러 폭주 시 dict 조립 + JSON 직렬화를 생략)
+_PRECOMPILED_BODIES: Dict[int, bytes] = {
+    code: orjson.dumps({
+        "success": False,
+        "message": message,
+        "errors": [{"code": f"HTTP_{code}", "message": message}],
+        "timestamp": ""
+    })
+    for code, message in {
+        status.HTTP_401_UNAUTHORIZED: "인증이 필요합니다",
+        status.HTTP_404_NOT_FOUND: "요청한 리소스를 찾을 수 없습니다",
+        status.HTTP_429_TOO_MANY_REQUESTS: "요청 한도를 초과했습니다",
+    }.items()
+}
+
+# 고정 메시지인 500 응답은 완전히 정적
+_STATIC_500_BODY: bytes = orjson.dumps({
+    "success": False,
+    "message": "서버 내부 오류가 발생했습니다",
+    "errors": [
+        {
+            "code": "INTERNAL_SERVER_ERROR",
+            "message": "예기치 않은 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+        }
+    ],
+    "timestamp": ""
+})
+
+# 기본 메시지 매핑 (사전 직렬화 본문 사용 가능 여부 판별용)
+_DEFAULT_MESSAGES: Dict[int, str] = {
+    status.HTTP_401_UNAUTHORIZED: "인증이 필요합니다",
+    status.HTTP_404_NOT_FOUND: "요청한 리소스를 찾을 수 없습니다",
+    status.HTTP_429_TOO_MANY_REQUESTS: "요청 한도를 초과했습니다",
+}
+
+async def custom_exception_handler(request: Request, exc: BaseCustomException) -> ORJSONResponse:
     """커스텀 예외 핸들러"""
-    
+
     # 로그 기록
-    logger.error(
-        f"Custom exception occurred: {exc.error_code} - {exc.message} | "
-        f"Path: {request.url.path} | Method: {request.method} | "
-        f"Details: {exc.details}"
-    )
+    # 4xx는 정상 트래픽에서도 발생하므로 details 직렬화/트레이스백 없이 경고만 남김
+    if exc.status_code >= 500:
+        logger.opt(lazy=True).error(
+            "Custom exception occurred: {}",
+            lambda: f"{exc.error_code} - {exc.message} | "
+                    f"Path: {request.url.path} | Method: {request.method} | "
+                    f"Details: {exc.details}"
+        )
+    else:
+        logger.warning(
+            f"Custom exception occurred: {exc.error_code} | "
+            f"Path: {request.url.path} | Method: {request.method}"
+        )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -195,16 +240,25 @@ async def custom_exception_handler(request: Request, exc: BaseCustomException) -
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """HTTP 예외 핸들러"""
     
-    # 로그 기록
-    logger.warning(
+    # 로그 기록 (4xx는 경고, 5xx만 에러)
+    log = logger.error if exc.status_code >= 500 else logger.warning
+    log(
         f"HTTP exception occurred: {exc.status_code} - {exc.detail} | "
         f"Path: {request.url.path} | Method: {request.method}"
     )
     
-    return JSONResponse(
+    # 기본 메시지와 동일하면 사전 직렬화된 본문 그대로 반환
+    if _DEFAULT_MESSAGES.get(exc.status_code) == exc.detail:
+        return Response(
+            content=_PRECOMPILED_BODIES[exc.status_code],
+            status_code=exc.status_code,
+            media_type="application/json"
+        )
+
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "success": False,
@@ -220,7 +274,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """일반 예외 핸들러"""
     
     # 로그 기록
@@ -230,17 +284,8 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
         exc_info=exc
     )
     
-    return JSONResponse(
+    return Response(
+        content=_STATIC_500_BODY,
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "success": False,
-            "message": "서버 내부 오류가 발생했습니다",
-            "errors": [
-                {
-                    "code": "INTERNAL_SERVER_ERROR",
-                    "message": "예기치 않은 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
-                }
-            ],
-            "timestamp": ""
-        }
+        media_type="application/json"
     )
\ No newline at end of file
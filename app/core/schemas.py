@@ -3,12 +3,32 @@ API 공통 스키마 정의
 표준화된 API 응답 형식 및 에러 처리
 """
 
+import time
+from dataclasses import dataclass, field as dataclass_field
 from typing import Any, Dict, Generic, List, Optional, TypeVar, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 DataType = TypeVar("DataType")
 
+# 응답 타임스탬프 문자열 캐시 (1초 해상도)
+# datetime.utcnow() + isoformat을 응답마다 수행하지 않도록 캐싱
+_ts_cache: Dict[str, Any] = {"t": 0.0, "s": ""}
+
+
+def utcnow_iso() -> str:
+    """
+    캐시된 UTC ISO-8601 타임스탬프 문자열 반환
+
+    Returns:
+        str: 1초 해상도로 캐시된 현재 시각 문자열
+    """
+    now = time.time()
+    if now - _ts_cache["t"] >= 1.0:
+        _ts_cache["t"] = now
+        _ts_cache["s"] = datetime.utcnow().isoformat()
+    return _ts_cache["s"]
+
 
 class APIResponse(BaseModel, Generic[DataType]):
     """
@@ -18,10 +38,12 @@ class APIResponse(BaseModel, Generic[DataType]):
     success: bool = Field(..., description="요청 성공 여부")
     message: str = Field(..., description="응답 메시지")
     data: Optional[DataType] = Field(None, description="응답 데이터")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="응답 시간")
-    
-    class Config:
-        schema_extra = {
+    timestamp: str = Field(default_factory=utcnow_iso, description="응답 시간")
+
+    model_config = ConfigDict(
+        frozen=True,
+        revalidate_instances="never",
+        json_schema_extra={
             "example": {
                 "success": True,
                 "message": "요청이 성공적으로 처리되었습니다",
@@ -29,16 +51,21 @@ class APIResponse(BaseModel, Generic[DataType]):
                 "timestamp": "2024-01-01T12:00:00.000Z"
             }
         }
+    )
+
 
+# 서버 내부에서만 생성되는 구조체들은 pydantic 검증이 불필요하므로
+# slots 데이터클래스로 두어 생성 비용과 객체 크기를 줄임
 
-class PaginationMeta(BaseModel):
+@dataclass(slots=True)
+class PaginationMeta:
     """페이지네이션 메타데이터"""
-    page: int = Field(..., description="현재 페이지 번호", ge=1)
-    size: int = Field(..., description="페이지 크기", ge=1, le=100)
-    total: int = Field(..., description="전체 항목 수", ge=0)
-    pages: int = Field(..., description="전체 페이지 수", ge=0)
-    has_next: bool = Field(..., description="다음 페이지 존재 여부")
-    has_prev: bool = Field(..., description="이전 페이지 존재 여부")
+    page: int       # 현재 페이지 번호
+    size: int       # 페이지 크기
+    total: int      # 전체 항목 수
+    pages: int      # 전체 페이지 수
+    has_next: bool  # 다음 페이지 존재 여부
+    has_prev: bool  # 이전 페이지 존재 여부
 
 
 class PaginatedResponse(BaseModel, Generic[DataType]):
@@ -46,15 +73,18 @@ class PaginatedResponse(BaseModel, Generic[DataType]):
     페이지네이션 응답 형식
     목록 API에서 페이지네이션 정보와 함께 데이터 반환
     """
+    model_config = ConfigDict(frozen=True, revalidate_instances="never")
+
     items: List[DataType] = Field(..., description="데이터 목록")
     meta: PaginationMeta = Field(..., description="페이지네이션 메타데이터")
 
 
-class ErrorDetail(BaseModel):
+@dataclass(slots=True)
+class ErrorDetail:
     """에러 상세 정보"""
-    code: str = Field(..., description="에러 코드")
-    message: str = Field(..., description="에러 메시지")
-    field: Optional[str] = Field(None, description="에러 발생 필드")
+    code: str                    # 에러 코드
+    message: str                 # 에러 메시지
+    field: Optional[str] = None  # 에러 발생 필드
 
 
 class ErrorResponse(BaseModel):
@@ -65,10 +95,12 @@ class ErrorResponse(BaseModel):
     success: bool = Field(False, description="요청 성공 여부")
     message: str = Field(..., description="에러 메시지")
     errors: Optional[List[ErrorDetail]] = Field(None, description="상세 에러 목록")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="에러 발생 시간")
-    
-    class Config:
-        schema_extra = {
+    timestamp: str = Field(default_factory=utcnow_iso, description="에러 발생 시간")
+
+    model_config = ConfigDict(
+        frozen=True,
+        revalidate_instances="never",
+        json_schema_extra={
             "example": {
                 "success": False,
                 "message": "요청 처리 중 오류가 발생했습니다",
@@ -82,26 +114,21 @@ class ErrorResponse(BaseModel):
                 "timestamp": "2024-01-01T12:00:00.000Z"
             }
         }
+    )
 
 
-class HealthCheckResponse(BaseModel):
+@dataclass(slots=True)
+class HealthCheckResponse:
     """헬스체크 응답"""
-    status: str = Field(..., description="서비스 상태")
-    timestamp: datetime = Field(default_factory=datetime.utcnow, description="확인 시간")
-    version: str = Field(..., description="API 버전")
-    database: str = Field(..., description="데이터베이스 연결 상태")
-    redis: str = Field(..., description="Redis 연결 상태")
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "status": "healthy",
-                "timestamp": "2024-01-01T12:00:00.000Z",
-                "version": "1.0.0",
-                "database": "connected",
-                "redis": "connected"
-            }
-        }
+    status: str             # 서비스 상태
+    version: str            # API 버전
+    database: str           # 데이터베이스 연결 상태
+    redis: str              # Redis 연결 상태
+    migrations: str = "unknown"  # 마이그레이션 진행 상태
+    pool_checkedin: int = 0      # 풀 유휴 커넥션 수
+    pool_checkedout: int = 0     # 사용 중 커넥션 수
+    pool_overflow: int = 0       # 오버플로 커넥션 수
+    timestamp: str = dataclass_field(default_factory=utcnow_iso)  # 확인 시간
 
 
 # 공통 응답 생성 함수들
@@ -115,7 +142,7 @@ def create_success_response(
         success=True,
         message=message,
         data=data
-    ).dict()
+    ).model_dump()
 
 
 def create_error_response(
@@ -127,7 +154,7 @@ def create_error_response(
     return ErrorResponse(
         message=message,
         errors=errors
-    ).dict()
+    ).model_dump()
 
 
 def create_paginated_response(
@@ -138,20 +165,22 @@ def create_paginated_response(
 ) -> Dict[str, Any]:
     """페이지네이션 응답 생성"""
     pages = (total + size - 1) // size  # 전체 페이지 수 계산
-    
-    paginated_data = PaginatedResponse[Any](
-        items=items,
-        meta=PaginationMeta(
-            page=page,
-            size=size,
-            total=total,
-            pages=pages,
-            has_next=page < pages,
-            has_prev=page > 1
-        )
-    )
-    
-    return create_success_response(
-        data=paginated_data.dict(),
-        message=f"총 {total}개의 항목을 조회했습니다"
-    )
\ No newline at end of file
+
+    # 모델 생성/모델 덤프 없이 dict 리터럴로 바로 조립
+    # (items 목록을 pydantic이 두 번 순회하던 비용 제거)
+    return {
+        "success": True,
+        "message": f"총 {total}개의 항목을 조회했습니다",
+        "data": {
+            "items": items,
+            "meta": {
+                "page": page,
+                "size": size,
+                "total": total,
+                "pages": pages,
+                "has_next": page < pages,
+                "has_prev": page > 1,
+            },
+        },
+        "timestamp": utcnow_iso(),
+    }
\ No newline at end of file
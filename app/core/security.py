@@ -3,14 +3,36 @@
 비밀번호 해싱, JWT 토큰 생성/검증 등
 """
 
+import asyncio
+import threading
 from datetime import datetime, timedelta
 from typing import Optional, Union, Any
-from jose import JWTError, jwt
+import bcrypt
+import jwt
+from cachetools import TTLCache
+from jwt import InvalidTokenError as JWTError
 from passlib.context import CryptContext
 from app.core.config import settings
 
+# 핫패스에서 매번 pydantic 속성 조회를 거치지 않도록 모듈 상수로 바인딩
+_SECRET_KEY = settings.SECRET_KEY
+_ALGORITHM = settings.ALGORITHM
+_ACCESS_TOKEN_TTL = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TOKEN_TTL = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+
 # 비밀번호 해싱 컨텍스트
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 해시 생성에만 사용 (검증은 bcrypt C 확장을 직접 호출)
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.HASH_ROUNDS,
+    bcrypt__ident="2b",
+)
+
+# 검증 완료된 토큰 캐시 (토큰 문자열 -> (subject, 타입, 만료 시각))
+# 동일 토큰의 반복 검증 시 HMAC 재계산을 생략
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_token_cache_lock = threading.Lock()
 
 
 def create_access_token(
@@ -29,9 +51,7 @@ def create_access_token(
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
+        expire = datetime.utcnow() + _ACCESS_TOKEN_TTL
     
     to_encode = {
         "exp": expire,
@@ -40,7 +60,7 @@ def create_access_token(
     }
     
     encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+        to_encode, _SECRET_KEY, algorithm=_ALGORITHM
     )
     return encoded_jwt
 
@@ -61,9 +81,7 @@ def create_refresh_token(
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(
-            days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-        )
+        expire = datetime.utcnow() + _REFRESH_TOKEN_TTL
     
     to_encode = {
         "exp": expire,
@@ -72,7 +90,7 @@ def create_refresh_token(
     }
     
     encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
+        to_encode, _SECRET_KEY, algorithm=_ALGORITHM
     )
     return encoded_jwt
 
@@ -88,21 +106,61 @@ def verify_token(token: str, token_type: str = "access") -> Optional[str]:
     Returns:
         Optional[str]: 토큰이 유효하면 subject, 그렇지 않으면 None
     """
+    # 캐시 히트 시 HMAC 검증 생략 (만료 시각은 매번 재확인)
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+    if cached is not None:
+        token_sub, token_type_payload, exp = cached
+        if token_type_payload != token_type:
+            return None
+        if exp is not None and exp <= datetime.utcnow().timestamp():
+            return None
+        return token_sub
+
     try:
         payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+            token, _SECRET_KEY, algorithms=[_ALGORITHM]
         )
         token_sub: str = payload.get("sub")
         token_type_payload: str = payload.get("type")
-        
+
         if token_sub is None or token_type_payload != token_type:
             return None
-            
+
+        with _token_cache_lock:
+            _token_cache[token] = (token_sub, token_type_payload, payload.get("exp"))
+
         return token_sub
     except JWTError:
         return None
 
 
+def warm_up() -> None:
+    """
+    해싱/토큰 백엔드 예열
+
+    passlib은 bcrypt 백엔드를 첫 호출 시점에 로드하므로 (~50ms),
+    워커 기동 시 미리 한 번 호출해 첫 로그인 요청의 지연을 제거
+    """
+    pwd_context.hash("warmup")
+    jwt.encode(
+        {"sub": "warmup", "exp": datetime.utcnow() + timedelta(seconds=1)},
+        _SECRET_KEY,
+        algorithm=_ALGORITHM,
+    )
+
+
+def invalidate_token(token: str) -> None:
+    """
+    캐시된 토큰 무효화 (로그아웃 등)
+
+    Args:
+        token: 무효화할 JWT 토큰
+    """
+    with _token_cache_lock:
+        _token_cache.pop(token, None)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     비밀번호 검증
@@ -114,7 +172,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: 비밀번호가 일치하면 True, 그렇지 않으면 False
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    # passlib의 스킴 탐색/식별자 파싱을 거치지 않고 bcrypt C 확장을 직접 호출
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+        )
+    except ValueError:
+        # 잘못된 해시 형식 등은 검증 실패로 처리
+        return False
 
 
 def get_password_hash(password: str) -> str:
@@ -130,6 +195,38 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    비밀번호 검증 (비동기)
+
+    bcrypt 연산(~수십 ms)이 이벤트 루프를 막지 않도록 워커 스레드로 위임
+    async 핸들러에서는 verify_password 대신 이 함수를 사용
+
+    Args:
+        plain_password: 평문 비밀번호
+        hashed_password: 해시된 비밀번호
+
+    Returns:
+        bool: 비밀번호가 일치하면 True, 그렇지 않으면 False
+    """
+    return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    비밀번호 해시 생성 (비동기)
+
+    bcrypt 연산이 이벤트 루프를 막지 않도록 워커 스레드로 위임
+
+    Args:
+        password: 평문 비밀번호
+
+    Returns:
+        str: 해시된 비밀번호
+    """
+    return await asyncio.to_thread(get_password_hash, password)
+
+
 def generate_password_reset_token(email: str) -> str:
     """
     비밀번호 재설정 토큰 생성
@@ -147,8 +244,8 @@ def generate_password_reset_token(email: str) -> str:
     exp = expires.timestamp()
     encoded_jwt = jwt.encode(
         {"exp": exp, "nbf": now, "sub": email, "type": "password_reset"},
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
+        _SECRET_KEY,
+        algorithm=_ALGORITHM
     )
     return encoded_jwt
 
@@ -165,7 +262,7 @@ def verify_password_reset_token(token: str) -> Optional[str]:
     """
     try:
         decoded_token = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+            token, _SECRET_KEY, algorithms=[_ALGORITHM]
         )
         token_type: str = decoded_token.get("type")
         if token_type != "password_reset":
@@ -192,8 +289,8 @@ def generate_email_verification_token(email: str) -> str:
     exp = expires.timestamp()
     encoded_jwt = jwt.encode(
         {"exp": exp, "nbf": now, "sub": email, "type": "email_verification"},
-        settings.SECRET_KEY,
-        algorithm=settings.ALGORITHM
+        _SECRET_KEY,
+        algorithm=_ALGORITHM
     )
     return encoded_jwt
 
@@ -210,7 +307,7 @@ def verify_email_verification_token(token: str) -> Optional[str]:
     """
     try:
         decoded_token = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+            token, _SECRET_KEY, algorithms=[_ALGORITHM]
         )
         token_type: str = decoded_token.get("type")
         if token_type != "email_verification":
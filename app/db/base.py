@@ -3,14 +3,33 @@
 모든 데이터베이스 모델이 상속받을 베이스 클래스 정의
 """
 
-from datetime import datetime
+import os
+import time
 from typing import Any
-from sqlalchemy import Column, DateTime, String
+from sqlalchemy import Column, DateTime, String, select, text
+from sqlalchemy.sql import Select, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
 import uuid
 
 
+def uuid7() -> uuid.UUID:
+    """
+    시간 정렬 UUIDv7 생성
+
+    uuid4는 무작위 값이라 PK B-tree 삽입이 페이지 전체에 흩어지지만,
+    UUIDv7은 밀리초 타임스탬프가 선두에 와서 최신 페이지에 순차 삽입됨
+
+    Returns:
+        uuid.UUID: 생성된 UUIDv7
+    """
+    ts_ms = time.time_ns() // 1_000_000
+    raw = bytearray(ts_ms.to_bytes(6, "big") + os.urandom(10))
+    raw[6] = (raw[6] & 0x0F) | 0x70  # 버전 7
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return uuid.UUID(bytes=bytes(raw))
+
+
 @as_declarative()
 class Base:
     """
@@ -25,22 +44,46 @@ class Base:
     def __tablename__(cls) -> str:
         return cls.__name__.lower()
 
+    @classmethod
+    def lite(cls, *columns: str) -> Select:
+        """
+        지정한 컬럼만 조회하는 SELECT 문 생성
+
+        전체 행을 ORM 객체로 하이드레이션하지 않고 필요한 컬럼만
+        튜플로 받아 목록 조회 시 메모리/GC 부담을 줄임
+
+        Args:
+            *columns: 조회할 컬럼 이름들
+
+        Returns:
+            Select: 해당 컬럼들만 포함한 SELECT 문
+
+        Example:
+            rows = await session.execute(
+                NewsArticle.lite("id", "title", "created_at")
+            )
+        """
+        return select(*[getattr(cls, name) for name in columns])
+
 
 class TimestampMixin:
     """
     생성/수정 시간 자동 관리 믹스인
     모든 모델에서 공통으로 사용
     """
+    # 서버 측 now()로 타임스탬프를 채워 행마다 Python datetime 생성을 생략
     created_at = Column(
-        DateTime,
-        default=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
         nullable=False,
         comment="생성 시간"
     )
+    # 실제 갱신은 update_updated_at_column() BEFORE UPDATE 트리거가 수행
+    # (f3b82c61a9d0 마이그레이션 참고 — server_onupdate는 선언일 뿐 DDL 없음)
     updated_at = Column(
-        DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
+        server_onupdate=func.now(),
         nullable=False,
         comment="수정 시간"
     )
@@ -51,11 +94,13 @@ class UUIDMixin:
     UUID 기본키 믹스인
     보안과 확장성을 위해 UUID 사용
     """
+    # ORM 삽입은 Python uuid7, Core/수동 INSERT는 서버 uuidv7() 함수가 채움
+    # (unique=True는 PK와 중복이고 파티션 테이블에서는 유효하지 않아 제거)
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
-        unique=True,
+        default=uuid7,
+        server_default=text("uuidv7()"),
         nullable=False,
         comment="고유 식별자"
     )
\ No newline at end of file
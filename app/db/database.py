@@ -2,7 +2,12 @@
 데이터베이스 연결 및 설정 모듈
 """
 
-from typing import AsyncGenerator
+import time
+import uuid
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Type
+import orjson
+from sqlalchemy import event, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -13,10 +18,51 @@ engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,  # SQL 쿼리 로깅 (개발 환경에서만)
     future=True,
-    pool_pre_ping=True,  # 연결 상태 확인
-    pool_recycle=300,    # 연결 재사용 시간 (5분)
+    # 관리형 PG의 유휴 커넥션 정리로 끊긴 연결이 체크아웃되는 사고가 있어
+    # pre_ping을 다시 활성화 (왕복 비용 < 실패 요청 비용)
+    pool_pre_ping=True,
+    pool_recycle=1800,    # 연결 재사용 시간 (30분)
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    # 컴파일된 SQL 캐시 상한 (기본 500은 엔드포인트 수 대비 부족,
+    # 무제한은 쿼리 형태가 다양할 때 메모리 누수 위험)
+    query_cache_size=1200,
+    # JSON/JSONB 직렬화를 stdlib json 대신 orjson으로 수행
+    # (dialect가 문자열로 직렬화해 드라이버에 넘기는 경로를 그대로 유지)
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads,
+    connect_args={
+        # 짧은 OLTP 쿼리에서는 PG JIT가 오히려 손해
+        "server_settings": {"jit": "off"},
+        # asyncpg 문장 캐시: 반복 쿼리 재파싱 방지
+        "statement_cache_size": 1024,
+        "prepared_statement_cache_size": 500,
+        # PgBouncer transaction 모드에서 이름 충돌 방지
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+    },
 )
 
+# 디버그 환경에서 컴파일 캐시 적중률 추적
+# (캐시 비호환 구문이 섞이면 miss가 계속 증가 — CI에서 탐지용)
+compiled_cache_stats = {"hit": 0, "miss": 0}
+
+if settings.DEBUG:
+    from sqlalchemy.engine.default import CACHE_HIT
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _track_compiled_cache(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        if context is not None and context.compiled is not None:
+            # cache_hit은 CacheStats enum이라 모든 멤버가 truthy —
+            # 반드시 CACHE_HIT 센티널과 동일성 비교해야 함
+            if context.cache_hit is CACHE_HIT:
+                compiled_cache_stats["hit"] += 1
+            else:
+                compiled_cache_stats["miss"] += 1
+
+
 # 세션 팩토리 생성
 AsyncSessionLocal = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
@@ -41,6 +87,89 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def bulk_insert(
+    session: AsyncSession,
+    model: Type[Any],
+    rows: List[Dict[str, Any]],
+    conflict_columns: Optional[Sequence[str]] = None,
+) -> None:
+    """
+    Core 레벨 다중 행 INSERT
+
+    행마다 ORM 인스턴스를 만들지 않고 단일 multi-row INSERT로 처리하여
+    크롤링 수집처럼 배치가 큰 경로에서 왕복/파싱 비용을 한 번으로 줄임
+
+    Args:
+        session: 데이터베이스 세션
+        model: 대상 모델 클래스
+        rows: 삽입할 행 딕셔너리 목록
+        conflict_columns: 지정 시 해당 컬럼 충돌 행은 무시 (ON CONFLICT DO NOTHING)
+    """
+    if not rows:
+        return
+
+    stmt = pg_insert(model)
+    if conflict_columns:
+        stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+
+    await session.execute(stmt, rows)
+
+
+# 헬스체크 프로브 결과 캐시 (5초)
+# k8s 류의 1초 간격 프로브가 풀을 실제 쿼리로 채우지 않도록 함
+_db_probe_cache: Dict[str, Any] = {"t": 0.0, "status": "unknown"}
+
+
+async def check_db_health() -> str:
+    """
+    데이터베이스 연결 상태 확인 (캐시됨)
+
+    SELECT 1 왕복은 최대 5초에 한 번만 수행하고
+    그 사이 프로브는 캐시된 결과를 반환
+
+    Returns:
+        str: "connected" 또는 "error"
+    """
+    now = time.monotonic()
+    if now - _db_probe_cache["t"] < 5.0 and _db_probe_cache["status"] != "unknown":
+        return _db_probe_cache["status"]
+
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        db_status = "connected"
+    except Exception:
+        db_status = "error"
+
+    _db_probe_cache["t"] = now
+    _db_probe_cache["status"] = db_status
+    return db_status
+
+
+# UUIDMixin.id의 server_default가 참조하는 서버 함수 — create_all보다
+# 먼저 존재해야 함. 운영 경로는 d91a6f03c7b4 마이그레이션이 동일 DDL 설치
+_UUIDV7_FN = """
+CREATE OR REPLACE FUNCTION uuidv7() RETURNS uuid AS $$
+  SELECT encode(
+    set_bit(
+      set_bit(
+        overlay(
+          uuid_send(gen_random_uuid())
+          PLACING substring(
+            int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+            FROM 3
+          )
+          FROM 1 FOR 6
+        ),
+        52, 1
+      ),
+      53, 1
+    ),
+    'hex')::uuid;
+$$ LANGUAGE sql VOLATILE;
+"""
+
+
 async def init_db() -> None:
     """
     데이터베이스 초기화
@@ -49,6 +178,10 @@ async def init_db() -> None:
     async with engine.begin() as conn:
         # 개발 환경에서만 테이블 자동 생성
         if settings.DEBUG:
+            # DEFAULT uuidv7() / digest() DDL이 참조하는 함수를 먼저 설치
+            # (마이그레이션은 create_all 이후에 돌기 때문)
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pgcrypto"))
+            await conn.execute(text(_UUIDV7_FN))
             await conn.run_sync(Base.metadata.create_all)
 
 
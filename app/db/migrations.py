@@ -0,0 +1,59 @@
+"""
+애플리케이션 내장 마이그레이션 실행 모듈
+서버 시작 시 MIGRATION_MODE 설정에 따라 Alembic 마이그레이션을 수행
+"""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Dict
+
+from alembic import command
+from alembic.config import Config
+from loguru import logger
+
+# 프로젝트 루트의 alembic.ini 경로
+_ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# 마이그레이션 진행 상태 (/health에서 노출)
+_migration_status: Dict[str, str] = {"state": "pending"}
+
+
+def get_migration_status() -> str:
+    """
+    현재 마이그레이션 상태 반환
+
+    Returns:
+        str: "pending" | "running" | "done" | "failed" | "skipped"
+    """
+    return _migration_status["state"]
+
+
+def _upgrade_to_head() -> None:
+    """Alembic upgrade head 실행 (동기, 워커 스레드에서 호출됨)"""
+    os.environ["ALEMBIC_EMBEDDED"] = "1"  # 앱 프로세스 내 실행임을 표시
+    alembic_cfg = Config(str(_ALEMBIC_INI))
+    command.upgrade(alembic_cfg, "head")
+
+
+async def run_migrations() -> None:
+    """
+    마이그레이션을 워커 스레드에서 실행
+    advisory lock은 alembic/env.py에서 획득하므로 여러 레플리카가
+    동시에 기동해도 한 프로세스만 실제 마이그레이션을 수행
+    """
+    _migration_status["state"] = "running"
+    try:
+        await asyncio.to_thread(_upgrade_to_head)
+        _migration_status["state"] = "done"
+        logger.success("✅ 데이터베이스 마이그레이션 완료")
+    except Exception as e:
+        # 백그라운드 태스크로 돌 때 재전파하면 미회수 예외 경고만 남음 —
+        # 상태는 /health의 migrations 필드("failed")로 노출됨
+        _migration_status["state"] = "failed"
+        logger.error(f"❌ 마이그레이션 실행 중 오류 발생: {e}")
+
+
+def mark_migrations_skipped() -> None:
+    """MIGRATION_MODE=skip일 때 상태 표시"""
+    _migration_status["state"] = "skipped"
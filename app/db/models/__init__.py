@@ -7,7 +7,7 @@
 from app.db.base import Base
 
 # 사용자 관련 모델
-from app.db.models.user import User, UserPreference, UserRole, EmailFrequency
+from app.db.models.user import User, UserPreference, UserRole, EmailFrequency, SummaryLength
 
 # 뉴스 관련 모델
 from app.db.models.news import (
@@ -16,16 +16,20 @@ from app.db.models.news import (
     NewsKeyword,
     NewsCategory,
     NewsStatus,
+    SummaryType,
     SentimentType
 )
 
 # 이메일 관련 모델
 from app.db.models.email import (
+    Recipient,
     EmailTemplate,
     EmailLog,
     EmailDigest,
+    DigestArticle,
     EmailStatus,
-    EmailType
+    EmailType,
+    DigestType
 )
 
 # 모든 모델을 하나의 리스트로 내보내기 (Alembic 자동 인식용)
@@ -36,17 +40,22 @@ __all__ = [
     "UserPreference", 
     "UserRole",
     "EmailFrequency",
+    "SummaryLength",
     # 뉴스 모델
     "NewsArticle",
     "NewsSummary",
     "NewsKeyword",
     "NewsCategory",
     "NewsStatus",
+    "SummaryType",
     "SentimentType",
     # 이메일 모델
+    "Recipient",
     "EmailTemplate",
     "EmailLog",
     "EmailDigest",
+    "DigestArticle",
     "EmailStatus",
     "EmailType",
+    "DigestType",
 ]
\ No newline at end of file
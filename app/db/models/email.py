@@ -2,11 +2,11 @@
 이메일 발송 관련 데이터베이스 모델
 """
 
-from sqlalchemy import Boolean, Column, String, Text, Integer, DateTime, Enum as SQLEnum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, ForeignKey, Index, PrimaryKeyConstraint, SmallInteger, String, Text, Integer, DateTime, UniqueConstraint, text, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import deferred, relationship
 from enum import Enum
-from datetime import datetime
-from app.db.base import Base, TimestampMixin, UUIDMixin
+from app.db.base import Base, TimestampMixin, UUIDMixin, uuid7
 
 
 class EmailStatus(str, Enum):
@@ -32,6 +32,43 @@ class EmailType(str, Enum):
     NOTIFICATION = "notification"      # 일반 알림
 
 
+class DigestType(str, Enum):
+    """다이제스트 유형 enum"""
+    DAILY = "daily"      # 일간
+    WEEKLY = "weekly"    # 주간
+    MONTHLY = "monthly"  # 월간
+
+
+class Recipient(Base, TimestampMixin):
+    """
+    수신자 차원 모델
+    발송 로그마다 반복되던 이메일/이름 문자열을 별도 테이블로 정규화
+    (로그 행 폭 축소 — 수백만 로그 행 대비 수신자는 수백 명 수준)
+    """
+    __tablename__ = "recipients"
+
+    # 좁은 차원 테이블이므로 UUID 대신 4바이트 정수 키 사용
+    id = Column(
+        Integer,
+        primary_key=True,
+        comment="수신자 ID"
+    )
+    email = Column(
+        String(255),
+        unique=True,
+        nullable=False,
+        comment="수신자 이메일 주소"
+    )
+    name = Column(
+        String(100),
+        nullable=True,
+        comment="수신자 이름"
+    )
+
+    def __repr__(self) -> str:
+        return f"<Recipient(email='{self.email}')>"
+
+
 class EmailTemplate(Base, UUIDMixin, TimestampMixin):
     """
     이메일 템플릿 모델
@@ -54,20 +91,21 @@ class EmailTemplate(Base, UUIDMixin, TimestampMixin):
     
     # 템플릿 내용
     subject_template = Column(
-        String(200),
+        String(150),
         nullable=False,
         comment="제목 템플릿"
     )
-    html_template = Column(
+    # 본문은 수십 KB까지 커질 수 있으므로 기본 조회에서 제외 (접근 시 로드)
+    html_template = deferred(Column(
         Text,
         nullable=False,
         comment="HTML 템플릿"
-    )
-    text_template = Column(
+    ))
+    text_template = deferred(Column(
         Text,
         nullable=True,
         comment="텍스트 템플릿"
-    )
+    ))
     
     # 템플릿 설정
     is_active = Column(
@@ -102,25 +140,55 @@ class EmailLog(Base, UUIDMixin, TimestampMixin):
     """
     __tablename__ = "email_logs"
 
+    __table_args__ = (
+        # 파티션 테이블의 PK/유니크 제약은 파티션 키를 포함해야 함
+        PrimaryKeyConstraint("id", "created_at"),
+        UniqueConstraint("message_id", "created_at", name="uq_emaillog_message_created"),
+        # 사용자별 최근 발송 내역 조회용
+        Index("ix_emaillog_user_sent", "user_id", "sent_at"),
+        # 재시도 워커의 상태별 스캔용
+        Index("ix_emaillog_status_created", "status", "created_at"),
+        # 발송 로그는 시간순 적재이므로 생성 시간 범위 조회는 BRIN으로 충분
+        Index(
+            "brin_emaillog_created",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # 월 단위 범위 파티셔닝 — 인덱스/바큠 비용을 파티션 크기로 제한
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    # 복합 PK는 위 PrimaryKeyConstraint가 선언하므로 믹스인의
+    # primary_key=True 플래그 없이 재정의 (이중 선언 SAWarning 방지)
+    id = Column(
+        UUID(as_uuid=True),
+        default=uuid7,
+        server_default=text("uuidv7()"),
+        nullable=False,
+        comment="고유 식별자"
+    )
+
     # 수신자 정보
+    # 단일 인덱스는 두지 않음 — ix_emaillog_user_sent 복합 인덱스의
+    # 선두 컬럼이 user_id 단독 조회를 이미 커버함
     user_id = Column(
         "user_id",
         UUIDMixin.id.type,
-        # ForeignKey("users.id"),
+        ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
         comment="수신 사용자 ID (회원인 경우)"
     )
-    recipient_email = Column(
-        String(255),
+    recipient_id = Column(
+        Integer,
+        ForeignKey("recipients.id"),
         nullable=False,
         index=True,
-        comment="수신자 이메일 주소"
-    )
-    recipient_name = Column(
-        String(100),
-        nullable=True,
-        comment="수신자 이름"
+        comment="수신자 ID"
     )
+    # 좁은 차원 테이블이므로 같은 왕복에서 JOIN으로 함께 로드
+    # (기본 lazy는 AsyncSession 접근 시 예외 — chunk 전반의 로딩 규약과 동일)
+    recipient = relationship("Recipient", lazy="joined", innerjoin=True)
     
     # 이메일 내용
     email_type = Column(
@@ -129,20 +197,22 @@ class EmailLog(Base, UUIDMixin, TimestampMixin):
         comment="이메일 유형"
     )
     subject = Column(
-        String(200),
+        String(150),
         nullable=False,
         comment="이메일 제목"
     )
-    html_content = Column(
+    # 목록 조회가 본문 바이트를 끌어오지 않도록 지연 로딩
+    # (상세 조회는 options(undefer(...))로 명시적으로 포함)
+    html_content = deferred(Column(
         Text,
         nullable=True,
         comment="HTML 내용"
-    )
-    text_content = Column(
+    ))
+    text_content = deferred(Column(
         Text,
         nullable=True,
         comment="텍스트 내용"
-    )
+    ))
     
     # 발송 정보
     status = Column(
@@ -152,19 +222,19 @@ class EmailLog(Base, UUIDMixin, TimestampMixin):
         comment="발송 상태"
     )
     sent_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=True,
         comment="발송 시간"
     )
     
     # 추적 정보
     opened_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=True,
         comment="읽은 시간"
     )
     clicked_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=True,
         comment="클릭한 시간"
     )
@@ -178,7 +248,6 @@ class EmailLog(Base, UUIDMixin, TimestampMixin):
     message_id = Column(
         String(255),
         nullable=True,
-        unique=True,
         comment="메시지 ID (SMTP)"
     )
     provider_response = Column(
@@ -201,7 +270,7 @@ class EmailLog(Base, UUIDMixin, TimestampMixin):
     )
     
     def __repr__(self) -> str:
-        return f"<EmailLog(recipient='{self.recipient_email}', type='{self.email_type}', status='{self.status}')>"
+        return f"<EmailLog(recipient_id={self.recipient_id}, type='{self.email_type}', status='{self.status}')>"
 
 
 class EmailDigest(Base, UUIDMixin, TimestampMixin):
@@ -211,15 +280,24 @@ class EmailDigest(Base, UUIDMixin, TimestampMixin):
     """
     __tablename__ = "email_digests"
 
+    __table_args__ = (
+        # 다이제스트도 날짜순 적재 — BRIN 범위 인덱스 사용
+        Index(
+            "brin_digest_date",
+            "digest_date",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
     # 다이제스트 정보
     digest_date = Column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        index=True,
         comment="다이제스트 날짜"
     )
     digest_type = Column(
-        SQLEnum("daily", "weekly", "monthly", name="digest_type_enum"),
+        SQLEnum(DigestType, name="digest_type_enum", native_enum=True),
         nullable=False,
         comment="다이제스트 유형"
     )
@@ -236,11 +314,14 @@ class EmailDigest(Base, UUIDMixin, TimestampMixin):
         comment="전체 요약"
     )
     
-    # 포함된 뉴스 기사들 (JSON)
-    article_ids = Column(
-        Text,  # JSON 배열로 저장
-        nullable=True,
-        comment="포함된 기사 ID들 (JSON 배열)"
+    # 포함된 뉴스 기사들 (digest_articles 조인 테이블 경유)
+    articles = relationship(
+        "NewsArticle",
+        secondary="digest_articles",
+        primaryjoin="EmailDigest.id == foreign(DigestArticle.digest_id)",
+        secondaryjoin="foreign(DigestArticle.article_id) == NewsArticle.id",
+        order_by="DigestArticle.position",
+        viewonly=True,
     )
     
     # 통계 정보
@@ -269,12 +350,49 @@ class EmailDigest(Base, UUIDMixin, TimestampMixin):
         comment="발송 실패 수"
     )
     
-    # 카테고리별 통계 (JSON)
+    # 카테고리별 통계 (JSONB)
     category_stats = Column(
-        Text,  # JSON 형태: {"politics": 5, "economy": 3}
+        JSONB,  # 예: {"politics": 5, "economy": 3}
         nullable=True,
-        comment="카테고리별 기사 수 (JSON)"
+        comment="카테고리별 기사 수 (JSONB)"
     )
     
     def __repr__(self) -> str:
-        return f"<EmailDigest(date='{self.digest_date}', type='{self.digest_type}')>"
\ No newline at end of file
+        return f"<EmailDigest(date='{self.digest_date}', type='{self.digest_type}')>"
+
+
+class DigestArticle(Base):
+    """
+    다이제스트-기사 연결 모델
+    다이제스트에 포함된 기사를 정규화된 조인 테이블로 관리
+    (JSONB 배열과 달리 SQL JOIN과 인덱스 역조회 가능)
+    """
+    __tablename__ = "digest_articles"
+
+    __table_args__ = (
+        # "기사 X를 포함한 다이제스트" 역조회용
+        Index("ix_digest_articles_article", "article_id", "digest_id"),
+    )
+
+    digest_id = Column(
+        UUIDMixin.id.type,
+        ForeignKey("email_digests.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="다이제스트 ID"
+    )
+    # news_articles는 (id, published_at) 복합 PK 파티션 테이블이라
+    # id 단독 FK를 걸 수 없음 — 참조 무결성은 애플리케이션에서 보장
+    article_id = Column(
+        UUIDMixin.id.type,
+        primary_key=True,
+        comment="기사 ID"
+    )
+    position = Column(
+        SmallInteger,
+        nullable=False,
+        default=0,
+        comment="다이제스트 내 기사 순서"
+    )
+
+    def __repr__(self) -> str:
+        return f"<DigestArticle(digest_id='{self.digest_id}', article_id='{self.article_id}')>"
\ No newline at end of file
@@ -2,12 +2,12 @@
 뉴스 관련 데이터베이스 모델
 """
 
-from sqlalchemy import Boolean, Column, String, Text, Integer, DateTime, Float, Enum as SQLEnum
+from sqlalchemy import Boolean, Column, Computed, ForeignKey, Index, LargeBinary, PrimaryKeyConstraint, String, Text, Integer, DateTime, Float, UniqueConstraint, text, Enum as SQLEnum
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy.sql import func
 from enum import Enum
-from datetime import datetime
-from app.db.base import Base, TimestampMixin, UUIDMixin
+from app.db.base import Base, TimestampMixin, UUIDMixin, uuid7
 
 
 class NewsCategory(str, Enum):
@@ -33,6 +33,13 @@ class NewsStatus(str, Enum):
     PUBLISHED = "published"      # 발행 완료
 
 
+class SummaryType(str, Enum):
+    """요약 길이 타입 enum"""
+    SHORT = "short"      # 짧은 요약
+    MEDIUM = "medium"    # 중간 요약
+    LONG = "long"        # 긴 요약
+
+
 class SentimentType(str, Enum):
     """감정 분석 결과 enum"""
     POSITIVE = "positive"        # 긍정적
@@ -47,6 +54,38 @@ class NewsArticle(Base, UUIDMixin, TimestampMixin):
     """
     __tablename__ = "news_articles"
 
+    __table_args__ = (
+        # 파티션 테이블의 PK/유니크 제약은 파티션 키를 포함해야 함
+        PrimaryKeyConstraint("id", "published_at"),
+        # 중복 검사는 1KB 가변 문자열 대신 20바이트 해시 비교로 수행
+        UniqueConstraint("url_sha1", "published_at", name="uq_news_urlsha_published"),
+        # 태그 필터가 seq scan으로 떨어지지 않도록 GIN 인덱스
+        Index("ix_news_tags_gin", "tags", postgresql_using="gin"),
+        # 카테고리 피드 페이지네이션 쿼리 커버용
+        Index("ix_news_pub_cat", "category", "published_at"),
+        # 크롤링 워커의 처리 상태별 스캔용
+        Index("ix_news_status_cat", "status", "category"),
+        # 시간순 삽입 테이블이므로 발행 시간 범위 조회는 BRIN으로 충분
+        Index(
+            "brin_news_published",
+            "published_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # 월 단위 범위 파티셔닝 — 인덱스/바큠 비용을 파티션 크기로 제한
+        {"postgresql_partition_by": "RANGE (published_at)"},
+    )
+
+    # 복합 PK는 위 PrimaryKeyConstraint가 선언하므로 믹스인의
+    # primary_key=True 플래그 없이 재정의 (이중 선언 SAWarning 방지)
+    id = Column(
+        UUID(as_uuid=True),
+        default=uuid7,
+        server_default=text("uuidv7()"),
+        nullable=False,
+        comment="고유 식별자"
+    )
+
     # 기본 정보
     title = Column(
         String(500),
@@ -66,12 +105,18 @@ class NewsArticle(Base, UUIDMixin, TimestampMixin):
     
     # 메타데이터
     url = Column(
-        String(1000),
-        unique=True,
+        Text,
         nullable=False,
-        index=True,
         comment="원본 뉴스 URL"
     )
+    # pgcrypto digest()로 채워지는 생성 컬럼 — 유니크 인덱스가 URL 전문이
+    # 아닌 고정 20바이트 키를 타므로 리프 밀도가 크게 올라감
+    url_sha1 = Column(
+        LargeBinary(20),
+        Computed("digest(url, 'sha1')", persisted=True),
+        nullable=False,
+        comment="URL SHA-1 해시 (중복 검사용)"
+    )
     source = Column(
         String(100),
         nullable=False,
@@ -98,14 +143,13 @@ class NewsArticle(Base, UUIDMixin, TimestampMixin):
     
     # 발행 정보
     published_at = Column(
-        DateTime,
+        DateTime(timezone=True),
         nullable=False,
-        index=True,
         comment="뉴스 발행 시간"
     )
     crawled_at = Column(
-        DateTime,
-        default=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
         nullable=False,
         comment="크롤링 시간"
     )
@@ -152,7 +196,7 @@ class NewsArticle(Base, UUIDMixin, TimestampMixin):
     
     # 이미지 정보
     thumbnail_url = Column(
-        String(1000),
+        String(500),
         nullable=True,
         comment="썸네일 이미지 URL"
     )
@@ -161,7 +205,10 @@ class NewsArticle(Base, UUIDMixin, TimestampMixin):
     summaries = relationship(
         "NewsSummary",
         back_populates="article",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        # 기사 목록 + 요약 반환 시 기사당 1쿼리(N+1) 대신
+        # IN 배치 1쿼리로 축약 (AsyncSession에서는 lazy 접근이 불가하기도 함)
+        lazy="selectin"
     )
     
     def __repr__(self) -> str:
@@ -179,8 +226,9 @@ class NewsSummary(Base, UUIDMixin, TimestampMixin):
     article_id = Column(
         "article_id",
         UUIDMixin.id.type,
-        # ForeignKey("news_articles.id"),
+        ForeignKey("news_articles.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
         comment="원본 기사 ID"
     )
     
@@ -203,8 +251,8 @@ class NewsSummary(Base, UUIDMixin, TimestampMixin):
     
     # 요약 타입
     summary_type = Column(
-        SQLEnum("short", "medium", "long", name="summary_type_enum"),
-        default="medium",
+        SQLEnum(SummaryType, name="summary_type_enum", native_enum=True),
+        default=SummaryType.MEDIUM,
         nullable=False,
         comment="요약 길이 타입"
     )
@@ -248,6 +296,16 @@ class NewsKeyword(Base, UUIDMixin, TimestampMixin):
     """
     __tablename__ = "news_keywords"
 
+    __table_args__ = (
+        # 카테고리별 빈도 조건 검색용 GIN 인덱스
+        Index(
+            "ix_news_keyword_cat_freq_gin",
+            "category_frequency",
+            postgresql_using="gin",
+            postgresql_ops={"category_frequency": "jsonb_path_ops"},
+        ),
+    )
+
     # 키워드 정보
     keyword = Column(
         String(100),
@@ -265,9 +323,9 @@ class NewsKeyword(Base, UUIDMixin, TimestampMixin):
     
     # 카테고리별 빈도
     category_frequency = Column(
-        Text,  # JSON 형태로 저장: {"politics": 10, "economy": 5}
+        JSONB,  # 예: {"politics": 10, "economy": 5}
         nullable=True,
-        comment="카테고리별 등장 빈도 (JSON)"
+        comment="카테고리별 등장 빈도 (JSONB)"
     )
     
     # 트렌드 정보
@@ -286,8 +344,8 @@ class NewsKeyword(Base, UUIDMixin, TimestampMixin):
     
     # 시간별 통계
     last_seen = Column(
-        DateTime,
-        default=datetime.utcnow,
+        DateTime(timezone=True),
+        server_default=func.now(),
         nullable=False,
         comment="마지막 등장 시간"
     )
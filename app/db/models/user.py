@@ -2,7 +2,8 @@
 사용자 관련 데이터베이스 모델
 """
 
-from sqlalchemy import Boolean, Column, String, Text, Enum as SQLEnum, Integer
+from sqlalchemy import Boolean, Column, ForeignKey, Index, String, Text, Enum as SQLEnum, Integer
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from enum import Enum
 from app.db.base import Base, TimestampMixin, UUIDMixin
@@ -23,6 +24,13 @@ class EmailFrequency(str, Enum):
     DISABLED = "disabled"    # 비활성화
 
 
+class SummaryLength(str, Enum):
+    """요약 길이 설정 enum"""
+    SHORT = "short"      # 짧은 요약
+    MEDIUM = "medium"    # 중간 요약
+    LONG = "long"        # 긴 요약
+
+
 class User(Base, UUIDMixin, TimestampMixin):
     """
     사용자 모델
@@ -109,7 +117,9 @@ class User(Base, UUIDMixin, TimestampMixin):
         "UserPreference",
         back_populates="user",
         cascade="all, delete-orphan",
-        uselist=False
+        uselist=False,
+        # 1:1 관계는 LEFT JOIN 한 번으로 함께 로드 (추가 왕복 없음)
+        lazy="joined"
     )
     
     def __repr__(self) -> str:
@@ -122,27 +132,38 @@ class UserPreference(Base, UUIDMixin, TimestampMixin):
     뉴스 카테고리 선호도 및 기타 설정
     """
     __tablename__ = "user_preferences"
+
+    __table_args__ = (
+        # "politics 선호 사용자" 같은 @> 조회를 인덱스 탐색으로 처리
+        Index(
+            "ix_user_pref_categories_gin",
+            "preferred_categories",
+            postgresql_using="gin",
+            postgresql_ops={"preferred_categories": "jsonb_path_ops"},
+        ),
+    )
     
     # 외래키
     user_id = Column(
         "user_id",
         UUIDMixin.id.type,
-        # ForeignKey("users.id"),
+        ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
         comment="사용자 ID"
     )
     
-    # 뉴스 카테고리 선호도 (JSON으로 저장)
+    # 뉴스 카테고리 선호도 (JSONB로 저장)
     preferred_categories = Column(
-        Text,  # JSON 형태로 저장: ["politics", "economy", "society"]
+        JSONB,  # 예: ["politics", "economy", "society"]
         nullable=True,
-        comment="선호 뉴스 카테고리 (JSON 배열)"
+        comment="선호 뉴스 카테고리 (JSONB 배열)"
     )
     
     # 요약 설정
     summary_length = Column(
-        SQLEnum("short", "medium", "long", name="summary_length_enum"),
-        default="medium",
+        SQLEnum(SummaryLength, name="summary_length_enum", native_enum=True),
+        default=SummaryLength.MEDIUM,
         nullable=False,
         comment="요약 길이 설정"
     )
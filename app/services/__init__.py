@@ -0,0 +1,4 @@
+"""
+서비스 레이어 패키지
+도메인별 비즈니스 로직 모듈
+"""
@@ -0,0 +1,54 @@
+"""
+다이제스트 생성 서비스 로직
+사용자 선호 카테고리 기반 기사 후보 선정
+"""
+
+from datetime import datetime
+from typing import List, Sequence
+
+from sqlalchemy import bindparam, lambda_stmt, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models import NewsArticle
+
+
+def _digest_candidates_stmt():
+    """
+    다이제스트 후보 기사 SELECT 문 생성
+
+    수천 사용자의 카테고리 목록이 제각각이어도 expanding bindparam은
+    컴파일 구조를 동일하게 유지하므로, lambda_stmt와 함께 쓰면
+    사용자별 변형이 컴파일 캐시 엔트리 하나를 공유함
+    """
+    return lambda_stmt(
+        lambda: select(NewsArticle)
+        .where(NewsArticle.category.in_(bindparam("cats", expanding=True)))
+        .where(NewsArticle.published_at > bindparam("since"))
+        .order_by(NewsArticle.importance_score.desc())
+        .limit(bindparam("lim"))
+    )
+
+
+async def get_digest_candidates(
+    session: AsyncSession,
+    categories: Sequence[str],
+    since: datetime,
+    limit: int = 20,
+) -> List[NewsArticle]:
+    """
+    선호 카테고리의 최근 기사 중 중요도 상위 기사 조회
+
+    Args:
+        session: 데이터베이스 세션
+        categories: 사용자 선호 카테고리 목록
+        since: 이 시각 이후 발행된 기사만 대상
+        limit: 다이제스트에 담을 최대 기사 수
+
+    Returns:
+        List[NewsArticle]: 중요도 내림차순 기사 목록
+    """
+    result = await session.execute(
+        _digest_candidates_stmt(),
+        {"cats": list(categories), "since": since, "lim": limit},
+    )
+    return list(result.scalars())
@@ -0,0 +1,106 @@
+"""
+이메일 관련 서비스 로직
+발송 로그 비동기 적재 (인프로세스 outbox 큐)
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from app.db.database import AsyncSessionLocal, bulk_insert
+from app.db.models import EmailLog
+
+# 큐 드레인 주기 / 배치 상한 — 50ms마다 모인 행을 한 번의 INSERT로 적재
+_DRAIN_INTERVAL = 0.05
+_MAX_BATCH = 500
+
+_log_queue: Optional["asyncio.Queue[Dict[str, Any]]"] = None
+_drain_task: Optional[asyncio.Task] = None
+
+
+def enqueue_email_log(row: Dict[str, Any]) -> None:
+    """
+    이메일 발송 로그 적재 요청
+
+    발송 경로에서 동기 INSERT 대신 호출 — 요청 지연이 DB 커밋에
+    묶이지 않고, 모인 행은 백그라운드에서 일괄 삽입됨
+
+    Args:
+        row: EmailLog 컬럼 기준 행 딕셔너리
+    """
+    if _log_queue is None:
+        raise RuntimeError("이메일 로그 큐가 초기화되지 않았습니다")
+    _log_queue.put_nowait(row)
+
+
+async def _flush(batch: List[Dict[str, Any]]) -> None:
+    """모인 로그 행을 단일 multi-row INSERT로 적재"""
+    if not batch:
+        return
+    try:
+        async with AsyncSessionLocal() as session:
+            await bulk_insert(session, EmailLog, batch)
+            await session.commit()
+    except Exception as e:
+        # 로그 적재 실패가 발송 자체를 막아서는 안 됨
+        logger.error(f"이메일 로그 일괄 적재 실패 ({len(batch)}건 유실): {e}")
+
+
+async def _drain_loop(queue: "asyncio.Queue[Dict[str, Any]]") -> None:
+    """
+    outbox 큐 드레인 루프
+
+    첫 행을 기다렸다가 50ms 동안(최대 500행) 추가 행을 모아
+    한 번의 왕복으로 삽입 — WAL fsync 횟수를 배치 크기만큼 절감
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await queue.get()]
+        deadline = loop.time() + _DRAIN_INTERVAL
+        while len(batch) < _MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        await _flush(batch)
+
+
+def start_email_log_writer() -> "asyncio.Queue[Dict[str, Any]]":
+    """
+    outbox 큐 및 드레인 태스크 시작 (lifespan 시작 시 호출)
+
+    Returns:
+        asyncio.Queue: 생성된 로그 큐 (app.state 노출용)
+    """
+    global _log_queue, _drain_task
+    _log_queue = asyncio.Queue()
+    _drain_task = asyncio.create_task(_drain_loop(_log_queue))
+    return _log_queue
+
+
+async def stop_email_log_writer() -> None:
+    """
+    드레인 태스크 종료 및 잔여 로그 플러시 (lifespan 종료 시 호출)
+
+    close_db() 이전에 호출해야 마지막 배치가 적재됨
+    """
+    global _log_queue, _drain_task
+    if _drain_task is not None:
+        _drain_task.cancel()
+        try:
+            await _drain_task
+        except asyncio.CancelledError:
+            pass
+        _drain_task = None
+
+    # 큐에 남은 행은 마지막 한 번의 INSERT로 비움
+    if _log_queue is not None:
+        remaining: List[Dict[str, Any]] = []
+        while not _log_queue.empty():
+            remaining.append(_log_queue.get_nowait())
+        await _flush(remaining)
+        _log_queue = None
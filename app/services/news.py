@@ -0,0 +1,85 @@
+"""
+뉴스 관련 서비스 로직
+크롤링 기사 일괄 적재, 트렌딩 키워드 조회 및 구체화 뷰 갱신
+"""
+
+from typing import Any, Dict, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import invalidate_prefix
+from app.db.database import bulk_insert, engine
+from app.db.models import NewsArticle
+
+# 트렌딩 키워드는 구체화 뷰에서 인덱스 조회로 가져옴 (기사 테이블 집계 없음)
+_TRENDING_KEYWORDS_QUERY = text(
+    "SELECT keyword, freq_1h, freq_24h, trend_score, last_seen "
+    "FROM mv_trending_keywords "
+    "ORDER BY trend_score DESC "
+    "LIMIT :limit"
+)
+
+
+async def bulk_ingest_articles(
+    session: AsyncSession,
+    records: List[Dict[str, Any]],
+    batch_size: int = 1000,
+) -> None:
+    """
+    크롤링된 기사 일괄 적재
+
+    기사당 한 번의 INSERT 왕복 대신 배치 단위 multi-row INSERT로 처리.
+    이미 수집된 URL은 url_sha1 해시 충돌 기준 ON CONFLICT DO NOTHING으로
+    무시되므로 SELECT 후 INSERT 하던 중복 확인 패턴이 필요 없음
+
+    Args:
+        session: 데이터베이스 세션
+        records: 기사 행 딕셔너리 목록 (NewsArticle 컬럼 기준)
+        batch_size: 문장당 최대 행 수
+    """
+    # 중복 판정은 생성 컬럼 url_sha1 기반 유니크 제약
+    # (파티션 테이블이므로 파티션 키 published_at 포함)
+    for start in range(0, len(records), batch_size):
+        await bulk_insert(
+            session,
+            NewsArticle,
+            records[start:start + batch_size],
+            conflict_columns=("url_sha1", "published_at"),
+        )
+
+    # 새 기사가 들어왔으므로 피드 응답 캐시 무효화
+    if records:
+        await invalidate_prefix("feed:")
+
+
+async def get_trending_keywords(
+    session: AsyncSession, limit: int = 50
+) -> List[Dict[str, Any]]:
+    """
+    트렌딩 키워드 목록 조회
+
+    Args:
+        session: 데이터베이스 세션
+        limit: 조회할 키워드 수
+
+    Returns:
+        List[Dict[str, Any]]: 트렌드 점수 내림차순 키워드 목록
+    """
+    result = await session.execute(_TRENDING_KEYWORDS_QUERY, {"limit": limit})
+    return [dict(row) for row in result.mappings()]
+
+
+async def refresh_trending_keywords() -> None:
+    """
+    트렌딩 키워드 구체화 뷰 갱신
+
+    스케줄러(Celery beat)에서 5분 간격으로 호출.
+    REFRESH ... CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없으므로
+    AUTOCOMMIT 커넥션을 사용
+    """
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(
+            text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_trending_keywords")
+        )
@@ -5,6 +5,7 @@
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";  -- UUID 생성 함수
 CREATE EXTENSION IF NOT EXISTS "pg_trgm";    -- 유사성 검색
 CREATE EXTENSION IF NOT EXISTS "unaccent";   -- 악센트 제거
+CREATE EXTENSION IF NOT EXISTS "pgcrypto";   -- digest() (url_sha1 생성 컬럼)
 
 -- 데이터베이스 인코딩 확인 (UTF-8이어야 함)
 SHOW server_encoding;
@@ -42,7 +43,7 @@ CREATE INDEX IF NOT EXISTS idx_users_is_active ON users(is_active);
 CREATE INDEX IF NOT EXISTS idx_users_created_at ON users(created_at);
 
 -- 뉴스 관련 인덱스
-CREATE INDEX IF NOT EXISTS idx_news_articles_url ON news_articles(url);
+-- (url 단일 인덱스는 제거됨 — 중복 검사는 url_sha1 유니크 제약이 담당)
 CREATE INDEX IF NOT EXISTS idx_news_articles_category ON news_articles(category);
 CREATE INDEX IF NOT EXISTS idx_news_articles_published_at ON news_articles(published_at);
 CREATE INDEX IF NOT EXISTS idx_news_articles_status ON news_articles(status);
@@ -57,7 +58,7 @@ CREATE INDEX IF NOT EXISTS idx_news_keywords_keyword ON news_keywords(keyword);
 CREATE INDEX IF NOT EXISTS idx_news_keywords_trending ON news_keywords(is_trending, trend_score DESC);
 
 -- 이메일 로그 인덱스
-CREATE INDEX IF NOT EXISTS idx_email_logs_recipient ON email_logs(recipient_email);
+CREATE INDEX IF NOT EXISTS idx_email_logs_recipient ON email_logs(recipient_id);
 CREATE INDEX IF NOT EXISTS idx_email_logs_status ON email_logs(status);
 CREATE INDEX IF NOT EXISTS idx_email_logs_type_sent ON email_logs(email_type, sent_at DESC);
 
@@ -3,22 +3,32 @@
 개인맞춤 뉴스 요약 이메일 서비스 API
 """
 
+import asyncio
 from contextlib import asynccontextmanager
-from datetime import datetime
+from dataclasses import asdict
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from loguru import logger
 import sys
 
 from app.core.config import settings
-from app.core.schemas import create_success_response, HealthCheckResponse
+from app.core.schemas import create_success_response, utcnow_iso, HealthCheckResponse
 from app.core.exceptions import (
     BaseCustomException,
     custom_exception_handler,
     http_exception_handler,
     general_exception_handler
 )
-from app.db.database import init_db, close_db
+from app.core.cache import init_cache, close_cache, check_redis_health
+from app.core.security import warm_up
+from app.db.database import check_db_health, engine, init_db, close_db
+from app.db.migrations import (
+    run_migrations,
+    get_migration_status,
+    mark_migrations_skipped,
+)
+from app.services.email import start_email_log_writer, stop_email_log_writer
 
 # 로그 설정
 logger.remove()
@@ -39,11 +49,31 @@ async def lifespan(app: FastAPI):
     try:
         # 애플리케이션 시작
         logger.info("🚀 뉴스한입 백엔드 서버 시작 중...")
-        
+
+        # bcrypt/JWT 백엔드 예열 (첫 로그인 요청 지연 제거)
+        warm_up()
+
         # 데이터베이스 연결 및 초기화
         await init_db()
         logger.success("✅ 데이터베이스 연결 성공")
-        
+
+        # Redis 읽기 캐시 클라이언트 초기화
+        await init_cache()
+        logger.success("✅ Redis 캐시 연결 성공")
+
+        # 이메일 발송 로그 outbox 큐 시작 (50ms 배치 적재)
+        app.state.email_log_queue = start_email_log_writer()
+
+        # 마이그레이션 실행 (MIGRATION_MODE 설정에 따라)
+        if settings.MIGRATION_MODE == "sync":
+            await run_migrations()
+        elif settings.MIGRATION_MODE == "async":
+            # 백그라운드 실행: 마이그레이션이 끝나기 전에 요청 수신 시작
+            # (참조를 들고 있지 않으면 태스크가 GC로 중단될 수 있음)
+            app.state.migration_task = asyncio.create_task(run_migrations())
+        else:
+            mark_migrations_skipped()
+
         logger.success("🎉 뉴스한입 백엔드 서버 시작 완료!")
         yield
         
@@ -54,7 +84,11 @@ async def lifespan(app: FastAPI):
         # 애플리케이션 종료
         logger.info("🛑 뉴스한입 백엔드 서버 종료 중...")
         
-        # 데이터베이스 연결 정리
+        # 잔여 이메일 로그를 DB 종료 전에 플러시
+        await stop_email_log_writer()
+
+        # Redis 및 데이터베이스 연결 정리
+        await close_cache()
         await close_db()
         logger.info("🔌 데이터베이스 연결 종료")
         
@@ -68,6 +102,7 @@ app = FastAPI(
     version=settings.VERSION,
     docs_url="/docs" if settings.DEBUG else None,  # 프로덕션에서는 문서 비활성화
     redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,  # orjson 기반 응답 직렬화
     lifespan=lifespan
 )
 
@@ -76,16 +111,30 @@ app.add_exception_handler(BaseCustomException, custom_exception_handler)
 app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
+# CORS 오리진은 불변 튜플로 고정 (미들웨어가 요청마다 순회)
+_CORS_ORIGINS = tuple(settings.BACKEND_CORS_ORIGINS)
+
 # CORS 미들웨어 설정
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.BACKEND_CORS_ORIGINS,
+    allow_origins=_CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
-    allow_headers=["*"],
-    expose_headers=["X-Total-Count", "X-Page-Count"]
+    # 와일드카드 대신 실제 사용하는 헤더만 명시 (Starlette가 집합 비교로 단축 처리)
+    allow_headers=["Authorization", "Content-Type", "X-Requested-With"],
+    expose_headers=["X-Total-Count", "X-Page-Count"],
+    # 브라우저가 preflight 응답을 24시간 캐싱 — 핫패스의 OPTIONS 왕복 제거
+    max_age=86400
 )
 
+# 루트 응답의 고정 정보 — 요청마다 dict를 다시 만들 필요 없음
+_ROOT_INFO = {
+    "name": settings.PROJECT_NAME,
+    "version": settings.VERSION,
+    "description": settings.DESCRIPTION,
+    "docs": "/docs" if settings.DEBUG else None,
+}
+
 # 향후 API 라우터들을 등록할 예정
 # app.include_router(auth_router, prefix="/api/v1/auth", tags=["인증"])
 # app.include_router(news_router, prefix="/api/v1/news", tags=["뉴스"])
@@ -98,14 +147,9 @@ async def root():
     루트 엔드포인트
     서버 기본 정보 반환
     """
+    # 응답 시간은 create_success_response의 timestamp가 담당
     return create_success_response(
-        data={
-            "name": settings.PROJECT_NAME,
-            "version": settings.VERSION,
-            "description": settings.DESCRIPTION,
-            "docs": "/docs" if settings.DEBUG else None,
-            "timestamp": datetime.utcnow()
-        },
+        data=_ROOT_INFO,
         message="뉴스한입 API 서버가 정상 작동 중입니다"
     )
 
@@ -117,20 +161,26 @@ async def health_check():
     서버 및 연결된 서비스들의 상태 확인
     """
     try:
-        # TODO: 실제 데이터베이스 및 Redis 연결 상태 확인
-        # 현재는 기본값으로 설정
-        database_status = "connected"
-        redis_status = "connected"
+        # DB 상태는 5초 캐시된 프로브로 확인 (프로브 폭주 시 풀 보호)
+        database_status = await check_db_health()
+        redis_status = await check_redis_health()
         
+        # 풀 포화 상태를 요청 타임아웃 이전에 노출
+        pool = engine.pool
         health_data = HealthCheckResponse(
             status="healthy",
             version=settings.VERSION,
             database=database_status,
-            redis=redis_status
+            redis=redis_status,
+            migrations=get_migration_status(),
+            pool_checkedin=pool.checkedin(),
+            pool_checkedout=pool.checkedout(),
+            # 유휴 풀에서 overflow()는 -pool_size를 반환하므로 0으로 클램프
+            pool_overflow=max(0, pool.overflow())
         )
         
         return create_success_response(
-            data=health_data.dict(),
+            data=asdict(health_data),
             message="모든 서비스가 정상 작동 중입니다"
         )
         
@@ -140,14 +190,15 @@ async def health_check():
             status="unhealthy",
             version=settings.VERSION,
             database="error",
-            redis="error"
+            redis="error",
+            migrations=get_migration_status()
         )
         
         return {
             "success": False,
             "message": "일부 서비스에 문제가 있습니다",
-            "data": health_data.dict(),
-            "timestamp": datetime.utcnow()
+            "data": asdict(health_data),
+            "timestamp": utcnow_iso()
         }
 
 